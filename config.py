@@ -10,12 +10,66 @@ A股自选股智能分析系统 - 配置管理模块
 3. 提供类型安全的配置访问接口
 """
 
+import importlib.util
+import logging
 import os
+import sys
+import tempfile
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from dotenv import load_dotenv, dotenv_values
 from dataclasses import dataclass, field
 
+logger = logging.getLogger(__name__)
+
+
+# 项目根目录下的 .env 文件路径（__file__ 不变，模块加载时计算一次）
+_ENV_PATH: Path = Path(__file__).resolve().parent / '.env'
+
+# 布尔型配置视为 True 的取值（集合查找，无需 lower() 分配新字符串）
+_TRUTHY = frozenset({'true', 'True', 'TRUE', '1', 'yes', 'on'})
+
+# .env 预编译生成的 Python 模块（见 Config.compile_env），存在时优先导入，省去 .env 解析
+_ENV_COMPILED_PATH: Path = _ENV_PATH.parent / '_env_compiled.py'
+
+# .env 是否已加载到 os.environ（每个进程只加载一次）
+_DOTENV_LOADED = False
+
+# .env 解析结果缓存：按文件签名 (st_mtime_ns, st_size) 失效
+_ENV_CACHE = {'signature': None, 'values': {}}
+
+
+def _env_file_signature(st: os.stat_result) -> Tuple[int, int]:
+    """文件签名：mtime 精度较粗或被保留 mtime 的复制覆盖时，靠文件大小兜底识别修改"""
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cached_dotenv_values(env_path: Path, signature: Tuple[int, int]) -> dict:
+    """
+    读取 .env 文件内容（带缓存），仅在文件签名变化后重新解析
+    
+    Args:
+        env_path: .env 文件路径
+        signature: 调用方 stat() 得到的文件签名，避免重复 stat
+    """
+    if signature != _ENV_CACHE['signature']:
+        _ENV_CACHE['values'] = dotenv_values(env_path)
+        _ENV_CACHE['signature'] = signature
+    return _ENV_CACHE['values']
+
+
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """解析逗号分隔的配置项，去除空白与空项；空字符串直接返回共享的空元组"""
+    if not value:
+        return ()
+    return tuple(item for item in (part.strip() for part in value.split(',')) if item)
+
+
+def _split_stock_codes(value: str) -> Tuple[str, ...]:
+    """解析自选股代码列表，代码字符串做 intern（数量少且不可变，后续比较可走身份判断）"""
+    return tuple(sys.intern(code) for code in _split_csv(value))
+
 
 @dataclass
 class Config:
@@ -25,11 +79,11 @@ class Config:
     设计说明：
     - 使用 dataclass 简化配置属性定义
     - 所有配置项从环境变量读取，支持默认值
-    - 类方法 get_instance() 实现单例访问
+    - 模块函数 get_config()（或类方法 get_instance()）实现单例访问
     """
     
     # === 自选股配置 ===
-    stock_list: List[str] = field(default_factory=list)
+    stock_list: Tuple[str, ...] = ()
 
     # === 飞书云文档配置 ===
     feishu_app_id: Optional[str] = None
@@ -55,8 +109,8 @@ class Config:
     openai_model: str = "gpt-4o-mini"  # OpenAI 兼容模型名称
     
     # === 搜索引擎配置（支持多 Key 负载均衡）===
-    tavily_api_keys: List[str] = field(default_factory=list)  # Tavily API Keys
-    serpapi_keys: List[str] = field(default_factory=list)  # SerpAPI Keys
+    tavily_api_keys: Tuple[str, ...] = ()  # Tavily API Keys
+    serpapi_keys: Tuple[str, ...] = ()  # SerpAPI Keys
     
     # === 通知配置（可同时配置多个，全部推送）===
     
@@ -73,11 +127,11 @@ class Config:
     # 邮件配置（只需邮箱和授权码，SMTP 自动识别）
     email_sender: Optional[str] = None  # 发件人邮箱
     email_password: Optional[str] = None  # 邮箱密码/授权码
-    email_receivers: List[str] = field(default_factory=list)  # 收件人列表（留空则发给自己）
+    email_receivers: Tuple[str, ...] = ()  # 收件人列表（留空则发给自己）
     
     # 自定义 Webhook（支持多个，逗号分隔）
     # 适用于：钉钉、Discord、Slack、自建服务等任意支持 POST JSON 的 Webhook
-    custom_webhook_urls: List[str] = field(default_factory=list)
+    custom_webhook_urls: Tuple[str, ...] = ()
     
     # 消息长度限制（字节）- 超长自动分批发送
     feishu_max_bytes: int = 20000  # 飞书限制约 20KB，默认 20000 字节
@@ -112,8 +166,8 @@ class Config:
     retry_base_delay: float = 1.0
     retry_max_delay: float = 30.0
     
-    # 单例实例存储
-    _instance: Optional['Config'] = None
+    # refresh_stock_list 上次读取时的 (.env 文件签名, STOCK_LIST 环境变量)，用于跳过未变化的刷新
+    _stock_list_source: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def get_instance(cls) -> 'Config':
@@ -125,9 +179,7 @@ class Config:
         2. 配置只从环境变量加载一次
         3. 所有模块共享相同配置
         """
-        if cls._instance is None:
-            cls._instance = cls._load_from_env()
-        return cls._instance
+        return get_config()
     
     @classmethod
     def _load_from_env(cls) -> 'Config':
@@ -139,70 +191,178 @@ class Config:
         2. .env 文件
         3. 代码中的默认值
         """
-        # 加载项目根目录下的 .env 文件
-        env_path = Path(__file__).parent / '.env'
-        load_dotenv(dotenv_path=env_path)
+        global _DOTENV_LOADED
+
+        # 加载项目根目录下的 .env 文件（reset_instance 后重建时不再重复解析）
+        # Docker / CI 环境通常没有 .env 文件，此时直接跳过 dotenv
+        if not _DOTENV_LOADED:
+            if not cls._load_compiled_env() and _ENV_PATH.is_file():
+                load_dotenv(dotenv_path=_ENV_PATH)
+            _DOTENV_LOADED = True
         
+        # 一次性快照环境变量，后续按 dict 查找，避免逐项调用 os.getenv
+        env = dict(os.environ)
+
+        def _b(key: str, default: str) -> bool:
+            return env.get(key, default) in _TRUTHY
+
         # 解析自选股列表（逗号分隔）
-        stock_list_str = os.getenv('STOCK_LIST', '')
-        stock_list = [
-            code.strip() 
-            for code in stock_list_str.split(',') 
-            if code.strip()
-        ]
+        stock_list = _split_stock_codes(env.get('STOCK_LIST', ''))
         
         # 如果没有配置，使用默认的示例股票
         if not stock_list:
-            stock_list = ['600519', '000001', '300750']
+            stock_list = ('600519', '000001', '300750')
         
         # 解析搜索引擎 API Keys（支持多个 key，逗号分隔）
-        tavily_keys_str = os.getenv('TAVILY_API_KEYS', '')
-        tavily_api_keys = [k.strip() for k in tavily_keys_str.split(',') if k.strip()]
-        
-        serpapi_keys_str = os.getenv('SERPAPI_API_KEYS', '')
-        serpapi_keys = [k.strip() for k in serpapi_keys_str.split(',') if k.strip()]
+        tavily_api_keys = _split_csv(env.get('TAVILY_API_KEYS', ''))
+        serpapi_keys = _split_csv(env.get('SERPAPI_API_KEYS', ''))
         
         return cls(
             stock_list=stock_list,
-            feishu_app_id=os.getenv('FEISHU_APP_ID'),
-            feishu_app_secret=os.getenv('FEISHU_APP_SECRET'),
-            feishu_folder_token=os.getenv('FEISHU_FOLDER_TOKEN'),
-            tushare_token=os.getenv('TUSHARE_TOKEN'),
-            gemini_api_key=os.getenv('GEMINI_API_KEY'),
-            gemini_model=os.getenv('GEMINI_MODEL', 'gemini-3-flash-preview'),
-            gemini_model_fallback=os.getenv('GEMINI_MODEL_FALLBACK', 'gemini-2.5-flash'),
-            gemini_request_delay=float(os.getenv('GEMINI_REQUEST_DELAY', '2.0')),
-            gemini_max_retries=int(os.getenv('GEMINI_MAX_RETRIES', '5')),
-            gemini_retry_delay=float(os.getenv('GEMINI_RETRY_DELAY', '5.0')),
-            openai_api_key=os.getenv('OPENAI_API_KEY'),
-            openai_base_url=os.getenv('OPENAI_BASE_URL'),
-            openai_model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+            feishu_app_id=env.get('FEISHU_APP_ID'),
+            feishu_app_secret=env.get('FEISHU_APP_SECRET'),
+            feishu_folder_token=env.get('FEISHU_FOLDER_TOKEN'),
+            tushare_token=env.get('TUSHARE_TOKEN'),
+            gemini_api_key=env.get('GEMINI_API_KEY'),
+            gemini_model=env.get('GEMINI_MODEL', 'gemini-3-flash-preview'),
+            gemini_model_fallback=env.get('GEMINI_MODEL_FALLBACK', 'gemini-2.5-flash'),
+            gemini_request_delay=float(env.get('GEMINI_REQUEST_DELAY', '2.0')),
+            gemini_max_retries=int(env.get('GEMINI_MAX_RETRIES', '5')),
+            gemini_retry_delay=float(env.get('GEMINI_RETRY_DELAY', '5.0')),
+            openai_api_key=env.get('OPENAI_API_KEY'),
+            openai_base_url=env.get('OPENAI_BASE_URL'),
+            openai_model=env.get('OPENAI_MODEL', 'gpt-4o-mini'),
             tavily_api_keys=tavily_api_keys,
             serpapi_keys=serpapi_keys,
-            wechat_webhook_url=os.getenv('WECHAT_WEBHOOK_URL'),
-            feishu_webhook_url=os.getenv('FEISHU_WEBHOOK_URL'),
-            telegram_bot_token=os.getenv('TELEGRAM_BOT_TOKEN'),
-            telegram_chat_id=os.getenv('TELEGRAM_CHAT_ID'),
-            email_sender=os.getenv('EMAIL_SENDER'),
-            email_password=os.getenv('EMAIL_PASSWORD'),
-            email_receivers=[r.strip() for r in os.getenv('EMAIL_RECEIVERS', '').split(',') if r.strip()],
-            custom_webhook_urls=[u.strip() for u in os.getenv('CUSTOM_WEBHOOK_URLS', '').split(',') if u.strip()],
-            feishu_max_bytes=int(os.getenv('FEISHU_MAX_BYTES', '20000')),
-            wechat_max_bytes=int(os.getenv('WECHAT_MAX_BYTES', '4000')),
-            database_path=os.getenv('DATABASE_PATH', './data/stock_analysis.db'),
-            log_dir=os.getenv('LOG_DIR', './logs'),
-            log_level=os.getenv('LOG_LEVEL', 'INFO'),
-            max_workers=int(os.getenv('MAX_WORKERS', '3')),
-            debug=os.getenv('DEBUG', 'false').lower() == 'true',
-            schedule_enabled=os.getenv('SCHEDULE_ENABLED', 'false').lower() == 'true',
-            schedule_time=os.getenv('SCHEDULE_TIME', '18:00'),
-            market_review_enabled=os.getenv('MARKET_REVIEW_ENABLED', 'true').lower() == 'true',
+            wechat_webhook_url=env.get('WECHAT_WEBHOOK_URL'),
+            feishu_webhook_url=env.get('FEISHU_WEBHOOK_URL'),
+            telegram_bot_token=env.get('TELEGRAM_BOT_TOKEN'),
+            telegram_chat_id=env.get('TELEGRAM_CHAT_ID'),
+            email_sender=env.get('EMAIL_SENDER'),
+            email_password=env.get('EMAIL_PASSWORD'),
+            email_receivers=_split_csv(env.get('EMAIL_RECEIVERS', '')),
+            custom_webhook_urls=_split_csv(env.get('CUSTOM_WEBHOOK_URLS', '')),
+            feishu_max_bytes=int(env.get('FEISHU_MAX_BYTES', '20000')),
+            wechat_max_bytes=int(env.get('WECHAT_MAX_BYTES', '4000')),
+            database_path=env.get('DATABASE_PATH', './data/stock_analysis.db'),
+            log_dir=env.get('LOG_DIR', './logs'),
+            log_level=env.get('LOG_LEVEL', 'INFO'),
+            max_workers=int(env.get('MAX_WORKERS', '3')),
+            debug=_b('DEBUG', 'false'),
+            schedule_enabled=_b('SCHEDULE_ENABLED', 'false'),
+            schedule_time=env.get('SCHEDULE_TIME', '18:00'),
+            market_review_enabled=_b('MARKET_REVIEW_ENABLED', 'true'),
         )
     
+    @staticmethod
+    def _load_compiled_env() -> bool:
+        """
+        导入预编译的环境变量模块
+        
+        Returns:
+            True 表示已从编译模块加载；模块不存在、.env 不存在或签名与当前 .env 不一致时返回 False
+        """
+        try:
+            env_signature = _env_file_signature(_ENV_PATH.stat())
+        except FileNotFoundError:
+            # 缺少源 .env（如 Docker 容器内）时不使用编译结果，
+            # 避免已从 .env / env_file 删除的配置项经 setdefault 重新生效
+            return False
+        if not _ENV_COMPILED_PATH.is_file():
+            return False
+        # 按文件路径加载，而非经 sys.path 导入，确保执行的正是 compile_env 生成的文件
+        spec = importlib.util.spec_from_file_location('_env_compiled', _ENV_COMPILED_PATH)
+        if spec is None or spec.loader is None:
+            return False
+        try:
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            compiled_signature = tuple(module.ENV_SIGNATURE)
+            compiled_values = dict(module.ENV_VALUES)
+        except Exception as e:
+            # 编译模块损坏（如写入中断）时不影响启动，回退到解析 .env
+            logger.warning(f"加载 {_ENV_COMPILED_PATH.name} 失败，回退到解析 .env: {e}")
+            return False
+        # 仅当编译时记录的 .env 签名与当前文件完全一致才使用（cp -p 覆盖旧文件等情况 mtime 可能更早）
+        if compiled_signature != env_signature:
+            return False
+        for key, value in compiled_values.items():
+            os.environ.setdefault(key, value)
+        return True
+
+    @classmethod
+    def compile_env(cls) -> Path:
+        """
+        将 .env 预编译为 Python 模块（生产部署可选）
+        
+        读取项目根目录下的 .env，输出到同目录的 _env_compiled.py（即 _load_from_env 加载的位置）。
+        生成的模块只包含源 .env 的文件签名与键值字典，启动时由 .pyc 缓存直接导入，
+        无需再解析 .env；与 load_dotenv 一致，已存在的系统环境变量优先。
+        .env 的 (mtime, size) 与编译时不一致，或 .env 不存在时，会自动回退到常规加载流程。
+        
+        用法（本机 / 服务器直接部署）：python -c "from config import Config; Config.compile_env()"
+        
+        Docker 部署不使用此功能：容器内配置由 docker-compose 的 env_file / environment 注入，
+        镜像中没有 .env，编译模块不会被加载；_env_compiled.py 已加入 .dockerignore，
+        不会被 `COPY *.py` 打包进镜像。
+        
+        .env 中含 ${VAR} 变量引用时拒绝编译（抛出 ValueError）：dotenv 会在编译时按当前环境展开，
+        写死的结果与运行时（cron、其他用户等）load_dotenv 的展开不一致，还会把系统环境变量中的
+        敏感值复制进生成文件。此类 .env 请继续使用常规加载流程。
+        
+        注意：生成文件包含 .env 中的敏感信息，不要提交到版本库或打包进镜像。
+        文件以 0600 权限原子写入（临时文件 + os.replace），中断的写入不会留下半个模块。
+        
+        Returns:
+            生成的模块路径
+        
+        Raises:
+            ValueError: .env 中存在 ${VAR} 变量引用
+        """
+        signature = _env_file_signature(_ENV_PATH.stat())
+        # 读取原始值（不做变量展开），避免把编译时的环境写死进生成文件
+        values = {
+            key: value
+            for key, value in dotenv_values(_ENV_PATH, interpolate=False).items()
+            if value is not None
+        }
+        interpolated_keys = [key for key, value in values.items() if '${' in value]
+        if interpolated_keys:
+            raise ValueError(
+                f"{_ENV_PATH.name} 中以下配置项包含 ${{VAR}} 变量引用，无法预编译: {', '.join(interpolated_keys)}"
+            )
+        lines = [
+            "# -*- coding: utf-8 -*-",
+            f"# 由 Config.compile_env() 根据 {_ENV_PATH.name} 自动生成，请勿手动编辑",
+            f"ENV_SIGNATURE = {signature!r}",
+            "ENV_VALUES = {",
+            *(f"    {key!r}: {value!r}," for key, value in values.items()),
+            "}",
+        ]
+        
+        content = "\n".join(lines) + "\n"
+        
+        # mkstemp 以 0600 创建临时文件（仅属主可读写），写完后原子替换目标文件
+        fd, tmp_path = tempfile.mkstemp(
+            dir=_ENV_COMPILED_PATH.parent, prefix='_env_compiled.', suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, _ENV_COMPILED_PATH)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        
+        # 删除旧的字节码缓存：其权限沿用旧源文件，且同一秒内重写、大小不变时可能不会失效
+        Path(importlib.util.cache_from_source(str(_ENV_COMPILED_PATH))).unlink(missing_ok=True)
+        return _ENV_COMPILED_PATH
+
     @classmethod
     def reset_instance(cls) -> None:
         """重置单例（主要用于测试）"""
-        cls._instance = None
+        global _instance
+        _instance = None
 
     def refresh_stock_list(self) -> None:
         """
@@ -212,34 +372,49 @@ class Config:
         1. .env 文件（本地开发、定时任务模式） - 修改后下次执行自动生效
         2. 系统环境变量（GitHub Actions、Docker） - 启动时固定，运行中不变
         """
+        # .env 与环境变量均未变化时直接返回（一次 stat + 比较）
+        try:
+            env_signature = _env_file_signature(_ENV_PATH.stat())
+        except FileNotFoundError:
+            env_signature = None
+        source = (env_signature, os.getenv('STOCK_LIST'))
+        if source == self._stock_list_source:
+            return
+
         # 若 .env 中配置了 STOCK_LIST，则以 .env 为准；否则回退到系统环境变量
-        env_path = Path(__file__).parent / '.env'
         stock_list_str = ''
-        if env_path.exists():
-            env_values = dotenv_values(env_path)
+        if env_signature is not None:
+            env_values = _cached_dotenv_values(_ENV_PATH, env_signature)
             stock_list_str = (env_values.get('STOCK_LIST') or '').strip()
 
         if not stock_list_str:
-            stock_list_str = os.getenv('STOCK_LIST', '')
+            stock_list_str = source[1] or ''
 
-        stock_list = [
-            code.strip()
-            for code in stock_list_str.split(',')
-            if code.strip()
-        ]
+        stock_list = _split_stock_codes(stock_list_str)
 
         if not stock_list:        
-            stock_list = ['000001']
+            stock_list = ('000001',)
+
+        # 解析成功后才记录来源签名；若解析抛异常，下次调用会重新读取而不是静默沿用旧列表
+        self._stock_list_source = source
 
-        self.stock_list = stock_list
+        if stock_list != self.stock_list:
+            self.stock_list = stock_list
+            # 自选股变化后，丢弃已缓存的校验结果
+            self.__dict__.pop('warnings_list', None)
     
     def validate(self) -> List[str]:
         """
         验证配置完整性
         
         Returns:
-            缺失或无效配置项的警告列表
+            缺失或无效配置项的警告列表（副本，调用方可自由修改）
         """
+        return list(self.warnings_list)
+
+    @cached_property
+    def warnings_list(self) -> List[str]:
+        """配置校验警告（单例配置不变，首次访问时计算并缓存）"""
         warnings = []
         
         if not self.stock_list:
@@ -257,12 +432,12 @@ class Config:
             warnings.append("提示：未配置搜索引擎 API Key (Tavily/SerpAPI)，新闻搜索功能将不可用")
         
         # 检查通知配置
-        has_notification = (
-            self.wechat_webhook_url or 
-            self.feishu_webhook_url or
-            (self.telegram_bot_token and self.telegram_chat_id) or
-            (self.email_sender and self.email_password)
-        )
+        has_notification = any((
+            self.wechat_webhook_url,
+            self.feishu_webhook_url,
+            self.telegram_bot_token and self.telegram_chat_id,
+            self.email_sender and self.email_password,
+        ))
         if not has_notification:
             warnings.append("提示：未配置通知渠道，将不发送推送通知")
         
@@ -274,15 +449,28 @@ class Config:
         
         自动创建数据库目录（如果不存在）
         """
-        db_path = Path(self.database_path)
+        return self.db_url
+
+    @cached_property
+    def db_url(self) -> str:
+        """数据库连接 URL（每个进程只创建一次目录并解析绝对路径）"""
+        db_path = Path(self.database_path).absolute()
         db_path.parent.mkdir(parents=True, exist_ok=True)
-        return f"sqlite:///{db_path.absolute()}"
+        return f"sqlite:///{db_path}"
 
 
 # === 便捷的配置访问函数 ===
+
+# 单例实例存储（模块级变量，get_config 热路径只需一次全局变量查找）
+_instance: Optional[Config] = None
+
+
 def get_config() -> Config:
     """获取全局配置实例的快捷方式"""
-    return Config.get_instance()
+    global _instance
+    if _instance is None:
+        _instance = Config._load_from_env()
+    return _instance
 
 
 if __name__ == "__main__":
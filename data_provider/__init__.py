@@ -10,11 +10,18 @@
 3. 防封禁流控策略
 """
 
-from .base import BaseFetcher, DataFetcherManager
-from .akshare_fetcher import AkshareFetcher
-from .tushare_fetcher import TushareFetcher
-from .baostock_fetcher import BaostockFetcher
-from .yfinance_fetcher import YfinanceFetcher
+import importlib
+
+# 延迟导入（PEP 562）：各数据源依赖较重（pandas/akshare/tushare 等），
+# 仅在首次访问对应名称时才导入子模块
+_LAZY = {
+    'BaseFetcher': '.base',
+    'DataFetcherManager': '.base',
+    'AkshareFetcher': '.akshare_fetcher',
+    'TushareFetcher': '.tushare_fetcher',
+    'BaostockFetcher': '.baostock_fetcher',
+    'YfinanceFetcher': '.yfinance_fetcher',
+}
 
 __all__ = [
     'BaseFetcher',
@@ -24,3 +31,16 @@ __all__ = [
     'BaostockFetcher',
     'YfinanceFetcher',
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
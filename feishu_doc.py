@@ -18,10 +18,12 @@ class FeishuDocManager:
         self.app_id = self.config.feishu_app_id
         self.app_secret = self.config.feishu_app_secret
         self.folder_token = self.config.feishu_folder_token
+        # 配置在实例生命周期内不变，只判断一次
+        self._configured = bool(self.app_id and self.app_secret and self.folder_token)
 
         # 初始化 SDK 客户端
         # SDK 会自动处理 tenant_access_token 的获取和刷新，无需人工干预
-        if self.is_configured():
+        if self._configured:
             self.client = lark.Client.builder() \
                 .app_id(self.app_id) \
                 .app_secret(self.app_secret) \
@@ -32,13 +34,13 @@ class FeishuDocManager:
 
     def is_configured(self) -> bool:
         """检查配置是否完整"""
-        return bool(self.app_id and self.app_secret and self.folder_token)
+        return self._configured
 
     def create_daily_doc(self, title: str, content_md: str) -> Optional[str]:
         """
         创建日报文档
         """
-        if not self.client or not self.is_configured():
+        if not self.client:
             logger.warning("飞书 SDK 未初始化或配置缺失，跳过创建")
             return None
 
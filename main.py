@@ -38,7 +38,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, date, timezone, timedelta
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from feishu_doc import FeishuDocManager
 
 from config import get_config, Config
@@ -475,7 +475,7 @@ class StockAnalysisPipeline:
     
     def run(
         self, 
-        stock_codes: Optional[List[str]] = None,
+        stock_codes: Optional[Sequence[str]] = None,
         dry_run: bool = False,
         send_notification: bool = True
     ) -> List[AnalysisResult]:
@@ -17,7 +17,7 @@ import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from itertools import cycle
 
 logger = logging.getLogger(__name__)
@@ -63,7 +63,7 @@ class SearchResponse:
 class BaseSearchProvider(ABC):
     """搜索引擎基类"""
     
-    def __init__(self, api_keys: List[str], name: str):
+    def __init__(self, api_keys: Sequence[str], name: str):
         """
         初始化搜索引擎
         
@@ -184,7 +184,7 @@ class TavilySearchProvider(BaseSearchProvider):
     文档：https://docs.tavily.com/
     """
     
-    def __init__(self, api_keys: List[str]):
+    def __init__(self, api_keys: Sequence[str]):
         super().__init__(api_keys, "Tavily")
     
     def _do_search(self, query: str, api_key: str, max_results: int) -> SearchResponse:
@@ -273,7 +273,7 @@ class SerpAPISearchProvider(BaseSearchProvider):
     文档：https://serpapi.com/
     """
     
-    def __init__(self, api_keys: List[str]):
+    def __init__(self, api_keys: Sequence[str]):
         super().__init__(api_keys, "SerpAPI")
     
     def _do_search(self, query: str, api_key: str, max_results: int) -> SearchResponse:
@@ -356,8 +356,8 @@ class SearchService:
     
     def __init__(
         self,
-        tavily_keys: Optional[List[str]] = None,
-        serpapi_keys: Optional[List[str]] = None,
+        tavily_keys: Optional[Sequence[str]] = None,
+        serpapi_keys: Optional[Sequence[str]] = None,
     ):
         """
         初始化搜索服务